@@ -1,18 +1,28 @@
-from fastapi import FastAPI, Depends, HTTPException, Query, Header, APIRouter
+from fastapi import FastAPI, Depends, HTTPException, Query, Header, APIRouter, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, DateTime, String, Integer, text
+from sqlalchemy import create_engine, event, select, Column, DateTime, String, Integer, text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
 from dateutil import parser
-from typing import List, Dict, Any, Optional
+from email.utils import format_datetime
+from time import time_ns
+from typing import List, Dict, Any, NamedTuple, Optional
 from pydantic import BaseModel, Field
+import numpy as np
 import asyncio
-import json
+import ciso8601
+import hashlib
 import logging
+import orjson
 import threading
+import weakref
 import os
+import re
 import httpx
 
 logger = logging.getLogger(__name__)
@@ -34,6 +44,10 @@ except ImportError:
     RESTREAM_CACHE_ENABLED = os.getenv("RESTREAM_CACHE_ENABLED", "True").lower() == "true"
     RESTREAM_CACHE_TTL = int(os.getenv("RESTREAM_CACHE_TTL", "60"))
 
+# Settings added after config.py.example was first copied, default when missing
+CACHE_POLL_INTERVAL = float(globals().get("CACHE_POLL_INTERVAL", os.getenv("CACHE_POLL_INTERVAL", "5")))
+SEARCH_INDEX_ENABLED = globals().get("SEARCH_INDEX_ENABLED", os.getenv("SEARCH_INDEX_ENABLED", "False").lower() == "true")
+
 # Restream cache
 _restream_cache = {"data": None, "updated_at": None}
 _restream_client = None
@@ -73,13 +87,29 @@ async def _restream_poller():
 async def lifespan(app):
     global _restream_client
     _restream_client = httpx.AsyncClient()
+    if SEARCH_INDEX_ENABLED:
+        install_search_index()
+    else:
+        remove_search_index()
+    cache_task = None
+    if CACHE_ENABLED:
+        install_version_triggers()
+        try:
+            await refresh_cache_coalesced()
+        except Exception:
+            logger.warning("Initial cache load failed, retrying in the background")
+        cache_task = asyncio.create_task(_cache_poller())
     task = None
     if RESTREAM_CACHE_ENABLED:
         task = asyncio.create_task(_restream_poller())
     yield
     if task:
         task.cancel()
+    if cache_task:
+        cache_task.cancel()
     await _restream_client.aclose()
+    # A refresh may still be running in a worker thread, wait for it
+    await asyncio.to_thread(close_refresh_connection)
 
 app = FastAPI(
     title=API_TITLE,
@@ -97,6 +127,29 @@ app.add_middleware(
 )
 router = APIRouter()
 engine = create_engine(DATABASE_URL)
+
+# WAL lets refresh reads run alongside external writers, mmap avoids read() copies
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def configure_sqlite_connection(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            # Independently, e.g. WAL fails on a read-only directory but mmap still helps
+            for pragma in SQLITE_PRAGMAS:
+                try:
+                    cursor.execute(pragma)
+                except Exception:
+                    logger.warning(f"Failed to apply SQLite pragma: {pragma}")
+        finally:
+            cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -138,22 +191,77 @@ SCHEDULE_EXAMPLES = {
     }
 }
 
-def create_schedule_responses(example_key: str):
-    """Create standard schedule endpoint response documentation"""
-    return {
+# Standard schedule endpoint response documentation, built once per example
+SCHEDULE_RESPONSES = {
+    example_key: MappingProxyType({
         200: {
             "description": "List of schedule entries",
             "content": {
                 "application/json": {
-                    "example": [SCHEDULE_EXAMPLES[example_key]]
+                    "example": [example]
                 }
             }
         }
-    }
+    })
+    for example_key, example in SCHEDULE_EXAMPLES.items()
+}
 
-cache_lock = threading.Lock()
-cache_data = {}
-cache_last_updated = None
+class SearchCorpus(NamedTuple):
+    text: str  # Lower-cased field values joined by NUL separators
+    offsets: np.ndarray  # Start of each row's value in text, plus an end sentinel
+
+class SerializedBucket(NamedTuple):
+    valid_from: int  # Epoch microseconds, body is correct from here...
+    valid_until: int  # ...until the next start/stop boundary (exclusive)
+    body: bytes
+    etag: str
+    last_modified: str  # HTTP date
+
+@dataclass(frozen=True)
+class CacheSnapshot:
+    """Immutable structure-of-arrays view of the schedule, sorted by start.
+
+    Refreshes build a new snapshot and publish it with a single assignment,
+    so readers never need a lock.
+    """
+    starts: np.ndarray  # Epoch microseconds
+    stops: np.ndarray  # Epoch microseconds
+    stop_order: np.ndarray  # Permutation sorting stops ascending
+    sorted_stops: np.ndarray  # stops[stop_order]
+    items: List[Dict[str, Any]]
+    title_corpus: SearchCorpus
+    description_corpus: SearchCorpus
+    index_by_id: Dict[int, int] = field(default_factory=dict)  # Row id -> position
+    # Row id -> (data, start, stop, parsed item), lets the next refresh skip unchanged rows
+    parsed_rows: Dict[int, tuple[str, datetime, datetime, Dict[str, Any]]] = field(default_factory=dict)
+    version: Optional[int] = None
+    loaded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Pre-serialized time buckets by key
+    serialized: Dict[str, SerializedBucket] = field(default_factory=dict)
+    # Stand-in served when loading failed, must never be cached by clients
+    fallback: bool = False
+    
+    @cached_property
+    def search(self):
+        """Memoized /when matches by lower-cased needles, dropped along with the snapshot on refresh"""
+        # Weak, so the cache doesn't form a cycle that keeps replaced snapshots alive until a full GC
+        ref = weakref.ref(self)
+        return lru_cache(maxsize=1024)(lambda title, description: search_snapshot(ref(), title, description))
+
+BUCKET_KEYS = ("all", "previous", "upnext", "now")
+NEVER = np.iinfo(np.int64).max
+
+# Serializes refreshers only, readers use whichever snapshot is published
+# Reentrant so run_refresh can hold it around the shared refresh connection
+cache_lock = threading.RLock()
+cache_snapshot: Optional[CacheSnapshot] = None
+# In-flight refresh, shared by every caller that asks for one while it runs
+_refresh_future: Optional[asyncio.Future] = None
+# Long-lived SQLite connection for refreshes, keeps its page cache between loads
+_refresh_connection = None
+VERSION_TABLE_NAME = f"{TABLE_NAME}_version"
+SEARCH_TABLE_NAME = f"{TABLE_NAME}_fts"
+search_index_available = False
 
 class Schedule(Base):
     __tablename__ = TABLE_NAME
@@ -171,10 +279,119 @@ def get_db():
     finally:
         db.close()
 
+def install_version_triggers():
+    """Maintain a schedule version counter via SQLite triggers for cheap cache invalidation"""
+    if engine.dialect.name != "sqlite":
+        return
+    
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE_NAME} (id INTEGER PRIMARY KEY, v INTEGER NOT NULL)",
+        f"INSERT OR IGNORE INTO {VERSION_TABLE_NAME} (id, v) VALUES (1, 0)",
+    ]
+    for operation in ("INSERT", "UPDATE", "DELETE"):
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_version_{operation.lower()} "
+            f"AFTER {operation} ON {TABLE_NAME} "
+            f"BEGIN UPDATE {VERSION_TABLE_NAME} SET v = v + 1 WHERE id = 1; END"
+        )
+    
+    try:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    except Exception:
+        logger.warning("Failed to install schedule version triggers, relying on cache TTL")
+
+def install_search_index():
+    """Maintain an FTS5 trigram index of titles and descriptions for /when on SQLite"""
+    global search_index_available
+    
+    if engine.dialect.name != "sqlite":
+        return
+    
+    # Guard json_extract so malformed data never breaks writes to the schedule table
+    columns = ", ".join(
+        f"CASE WHEN json_valid(NEW.data) THEN json_extract(NEW.data, '$.{name}') END"
+        for name in ("title", "description")
+    )
+    insert_new = f"INSERT INTO {SEARCH_TABLE_NAME} (rowid, title, description) SELECT NEW.id, {columns};"
+    delete_old = f"DELETE FROM {SEARCH_TABLE_NAME} WHERE rowid = OLD.id;"
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE_NAME} USING fts5(title, description, tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_fts_insert AFTER INSERT ON {TABLE_NAME} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_fts_update AFTER UPDATE ON {TABLE_NAME} BEGIN {delete_old} {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {TABLE_NAME}_fts_delete AFTER DELETE ON {TABLE_NAME} BEGIN {delete_old} END",
+        # Backfill rows written before the triggers existed
+        f"INSERT INTO {SEARCH_TABLE_NAME} (rowid, title, description) "
+        f"SELECT id, {columns.replace('NEW.', '')} FROM {TABLE_NAME} "
+        f"WHERE id NOT IN (SELECT rowid FROM {SEARCH_TABLE_NAME})",
+    ]
+    
+    try:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+        search_index_available = True
+    except Exception:
+        logger.warning("Failed to install FTS5 search index, falling back to in-memory search")
+
+def remove_search_index():
+    """Drop the FTS5 index and its triggers so writers without FTS5 support keep working"""
+    if engine.dialect.name != "sqlite":
+        return
+    
+    statements = [
+        f"DROP TRIGGER IF EXISTS {TABLE_NAME}_fts_{operation}"
+        for operation in ("insert", "update", "delete")
+    ]
+    statements.append(f"DROP TABLE IF EXISTS {SEARCH_TABLE_NAME}")
+    
+    try:
+        with engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+    except Exception:
+        logger.warning("Failed to remove FTS5 search index")
+
+def search_index_rows(snapshot: CacheSnapshot, title: Optional[str], description: Optional[str]) -> Optional[np.ndarray]:
+    """Match snapshot rows through the FTS5 index, or None if it can't answer the query"""
+    if not search_index_available:
+        return None
+    
+    terms = []
+    for column, needle in (("title", title), ("description", description)):
+        if not needle:
+            continue
+        # Trigrams only match substrings of at least three characters
+        if len(needle) < 3:
+            return None
+        phrase = needle.replace('"', '""')
+        terms.append(f'{column} : "{phrase}"')
+    
+    try:
+        with engine.connect() as conn:
+            ids = conn.execute(
+                text(f"SELECT rowid FROM {SEARCH_TABLE_NAME} WHERE {SEARCH_TABLE_NAME} MATCH :query"),
+                {"query": " OR ".join(terms)}
+            ).scalars()
+            rows = sorted(snapshot.index_by_id[id_] for id_ in ids if id_ in snapshot.index_by_id)
+    except Exception:
+        logger.warning("FTS5 search failed, falling back to in-memory search")
+        return None
+    return np.array(rows, dtype=np.int64)
+
+def get_schedule_version(db: Session) -> Optional[int]:
+    """Read the schedule version counter, or None if it isn't maintained"""
+    try:
+        return db.execute(text(f"SELECT v FROM {VERSION_TABLE_NAME} WHERE id = 1")).scalar()
+    except Exception:
+        db.rollback()
+        return None
+
 def get_parsed_data(schedule_item):
     try:
-        parsed_data = json.loads(schedule_item.data)
-    except json.JSONDecodeError:
+        parsed_data = orjson.loads(schedule_item.data)
+    except orjson.JSONDecodeError:
         parsed_data = {"raw_data": schedule_item.data}
     
     return {
@@ -184,141 +401,390 @@ def get_parsed_data(schedule_item):
         **parsed_data
     }
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def to_epoch_us(dt: datetime) -> int:
+    """Convert a datetime to exact epoch microseconds, treating naive values as UTC"""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - EPOCH) // timedelta(microseconds=1)
+
+def now_epoch_us() -> int:
+    return time_ns() // 1000
+
+def build_search_corpus(items: list, key: str) -> SearchCorpus:
+    """Lower-case a field of every item once into a single searchable string"""
+    values = [str(item[key]).lower() if key in item else "" for item in items]
+    lengths = np.fromiter((len(value) + 1 for value in values), dtype=np.int64, count=len(values))
+    offsets = np.concatenate((np.zeros(1, dtype=np.int64), np.cumsum(lengths)))
+    return SearchCorpus("\0".join(values), offsets)
+
+def search_corpus(corpus: SearchCorpus, needle: str) -> np.ndarray:
+    """Return indices of rows whose value contains the (lower-cased) needle"""
+    haystack, offsets = corpus
+    rows = []
+    pos = haystack.find(needle)
+    while pos != -1:
+        row = int(np.searchsorted(offsets, pos, side="right")) - 1
+        row_end = int(offsets[row + 1]) - 1
+        if pos + len(needle) <= row_end:
+            rows.append(row)
+            # One match per row is enough, resume at the next row
+            pos = row_end + 1
+        else:
+            pos += 1
+        pos = haystack.find(needle, pos)
+    return np.array(rows, dtype=np.int64)
+
+def select_bucket(key: str, snapshot: CacheSnapshot, t: int) -> list:
+    """Pick the items of a time bucket at epoch time t using binary searches"""
+    items = snapshot.items
+    if key == "all":
+        return list(items)
+    if key == "previous":
+        # Entries whose stop is strictly in the past, returned in start order
+        ended = int(np.searchsorted(snapshot.sorted_stops, t, side="left"))
+        return [items[i] for i in np.sort(snapshot.stop_order[:ended])]
+    # Everything before this index has started
+    started = int(np.searchsorted(snapshot.starts, t, side="right"))
+    if key == "upnext":
+        return items[started:]
+    if key == "now":
+        return [items[i] for i in np.flatnonzero(snapshot.stops[:started] >= t)]
+    return []
+
+def next_bucket_change(snapshot: CacheSnapshot, t: int) -> int:
+    """Return the first epoch time after t at which any time bucket changes"""
+    started = int(np.searchsorted(snapshot.starts, t, side="right"))
+    next_start = int(snapshot.starts[started]) if started < len(snapshot.starts) else NEVER
+    # An entry becomes previous once its stop is strictly in the past
+    ended = int(np.searchsorted(snapshot.sorted_stops, t, side="left"))
+    next_stop = int(snapshot.sorted_stops[ended]) + 1 if ended < len(snapshot.sorted_stops) else NEVER
+    return min(next_start, next_stop)
+
+def last_bucket_change(snapshot: CacheSnapshot, t: int) -> int:
+    """Return the latest epoch time up to t at which any time bucket changed"""
+    started = int(np.searchsorted(snapshot.starts, t, side="right"))
+    last_start = int(snapshot.starts[started - 1]) if started else 0
+    ended = int(np.searchsorted(snapshot.sorted_stops, t, side="left"))
+    last_stop = int(snapshot.sorted_stops[ended - 1]) + 1 if ended else 0
+    return max(last_start, last_stop)
+
+def serialize_bucket(key: str, snapshot: CacheSnapshot, t: int) -> SerializedBucket:
+    """Serialize a time bucket once, with the time range and validators it stays valid for"""
+    body = orjson.dumps(select_bucket(key, snapshot, t))
+    modified = to_epoch_us(snapshot.loaded_at)
+    if key == "all":
+        valid_until = NEVER
+    else:
+        valid_until = next_bucket_change(snapshot, t)
+        modified = max(modified, last_bucket_change(snapshot, t))
+    return SerializedBucket(
+        valid_from=t,
+        valid_until=valid_until,
+        body=body,
+        # Content hash, so the tag is stable across workers and refreshes
+        etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        last_modified=format_datetime(EPOCH + timedelta(microseconds=modified), usegmt=True),
+    )
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison against a strong ETag"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
 def check_cache_validity(db: Session):
-    global cache_last_updated
+    snapshot = cache_snapshot
     
     if not CACHE_ENABLED:
         return False
         
-    if cache_last_updated is None:
+    if snapshot is None:
         return False
     
     # Check TTL
     if CACHE_TTL > 0:
-        cache_age = (datetime.now(timezone.utc) - cache_last_updated).total_seconds()
+        cache_age = (datetime.now(timezone.utc) - snapshot.loaded_at).total_seconds()
         if cache_age > CACHE_TTL:
             return False
     
-    # Check database timestamps if available
-    try:
-        last_db_update = db.execute(
-            text(f"SELECT MAX(COALESCE(updated_at, created_at, datetime('now'))) FROM {TABLE_NAME}")
-        ).scalar()
-        
-        if last_db_update and last_db_update > cache_last_updated:
-            return False
-    except:
-        # If timestamp columns don't exist, rely on TTL only
-        pass
+    # Check the version counter if available, otherwise rely on TTL only
+    version = get_schedule_version(db)
+    if version is not None and version != snapshot.version:
+        return False
     
     return True
 
-def refresh_cache(db: Session):
-    global cache_data, cache_last_updated
+def build_rows(rows, previous_rows: dict) -> tuple[list, np.ndarray, np.ndarray, list, dict]:
+    """Turn (id, start, stop, data) rows into ids, epoch arrays, items and parsed_rows.
+
+    The per-row work is kept to one tight pass: timestamps are only normalized
+    to naive UTC here and converted to epoch microseconds in bulk by numpy.
+    """
+    utc = timezone.utc
+    ids, starts, stops, items = [], [], [], []
+    parsed_rows = {}
+    
+    for item in rows:
+        id_, start, stop, data = item
+        try:
+            cached = previous_rows.get(id_)
+            if cached is not None and cached[0] == data and cached[1] == start and cached[2] == stop:
+                parsed_item = cached[3]
+            else:
+                parsed_item = get_parsed_data(item)
+            start_utc = start if start.tzinfo is None else start.astimezone(utc).replace(tzinfo=None)
+            stop_utc = stop if stop.tzinfo is None else stop.astimezone(utc).replace(tzinfo=None)
+        except Exception:
+            # Skip malformed records
+            continue
+        parsed_rows[id_] = (data, start, stop, parsed_item)
+        ids.append(id_)
+        starts.append(start_utc)
+        stops.append(stop_utc)
+        items.append(parsed_item)
+    
+    # Naive UTC datetimes -> microseconds since epoch in C, int64 covers every datetime
+    starts = np.array(starts, dtype="datetime64[us]").astype(np.int64)
+    stops = np.array(stops, dtype="datetime64[us]").astype(np.int64)
+    return ids, starts, stops, items, parsed_rows
+
+def load_schedule(
+    db: Session,
+    version: Optional[int] = None,
+    previous: Optional[CacheSnapshot] = None
+) -> CacheSnapshot:
+    """Query all schedule entries into start-sorted arrays and search corpora.
+
+    Rows whose data, start and stop are unchanged since the previous snapshot
+    reuse its parsed item instead of decoding the JSON again.
+    """
+    # Plain column rows, streamed in batches, skip ORM object hydration
+    table = Schedule.__table__
+    rows = db.execute(
+        select(table.c.id, table.c.start, table.c.stop, table.c.data).execution_options(yield_per=1000)
+    )
+    previous_rows = previous.parsed_rows if previous is not None else {}
+    ids, starts, stops, items, parsed_rows = build_rows(rows, previous_rows)
+    
+    order = np.argsort(starts, kind="stable")
+    items = [items[i] for i in order]
+    stops = stops[order]
+    stop_order = np.argsort(stops, kind="stable")
+    return CacheSnapshot(
+        starts=starts[order],
+        stops=stops,
+        stop_order=stop_order,
+        sorted_stops=stops[stop_order],
+        items=items,
+        title_corpus=build_search_corpus(items, "title"),
+        description_corpus=build_search_corpus(items, "description"),
+        index_by_id={ids[i]: position for position, i in enumerate(order)},
+        parsed_rows=parsed_rows,
+        version=version,
+    )
+
+def refresh_cache(db: Session) -> CacheSnapshot:
+    global cache_snapshot
     
     with cache_lock:
-        now = datetime.now(timezone.utc)
-        
-        all_items = db.query(Schedule).all()
-        
-        cache_data = {
-            "previous": [],
-            "upnext": [],
-            "now": [],
-            "all": []
-        }
-        
-        for item in all_items:
-            parsed_item = get_parsed_data(item)
-            cache_data["all"].append(parsed_item)
-            
-            if item.stop < now:
-                cache_data["previous"].append(parsed_item)
-            elif item.start > now:
-                cache_data["upnext"].append(parsed_item)
-            elif item.start <= now <= item.stop:
-                cache_data["now"].append(parsed_item)
+        # Read the version before loading so writes racing the load invalidate it
+        version = get_schedule_version(db)
+        snapshot = load_schedule(db, version, cache_snapshot)
+        t = now_epoch_us()
+        for key in BUCKET_KEYS:
+            snapshot.serialized[key] = serialize_bucket(key, snapshot, t)
+        cache_snapshot = snapshot
+        return snapshot
+
+def run_refresh() -> CacheSnapshot:
+    """Refresh the cache with a dedicated session, for use off the event loop"""
+    global _refresh_connection
+    
+    if engine.dialect.name != "sqlite":
+        db = SessionLocal()
+        try:
+            return refresh_cache(db)
+        finally:
+            db.close()
+    
+    with cache_lock:
+        # Opened lazily so it is never shared across forked workers
+        if _refresh_connection is None:
+            _refresh_connection = engine.connect()
+        try:
+            # The session owns and ends its transaction, the connection stays open
+            with Session(bind=_refresh_connection) as db:
+                return refresh_cache(db)
+        except Exception:
+            _refresh_connection.close()
+            _refresh_connection = None
+            raise
+
+def close_refresh_connection():
+    """Close the long-lived refresh connection once no refresh is using it"""
+    global _refresh_connection
+    
+    with cache_lock:
+        if _refresh_connection is not None:
+            _refresh_connection.close()
+            _refresh_connection = None
+
+async def refresh_cache_coalesced() -> CacheSnapshot:
+    """Refresh the cache in a worker thread, sharing one refresh between concurrent callers"""
+    global _refresh_future
+    
+    if _refresh_future is None:
+        future = asyncio.ensure_future(asyncio.to_thread(run_refresh))
+        _refresh_future = future
         
-        cache_last_updated = datetime.now(timezone.utc)
+        def clear(done):
+            global _refresh_future
+            if _refresh_future is done:
+                _refresh_future = None
+        future.add_done_callback(clear)
+    
+    # Shield so a cancelled request doesn't cancel the refresh for everyone else
+    return await asyncio.shield(_refresh_future)
 
-def get_cached_data(key: str, db: Session):
+def cache_is_current() -> bool:
+    db = SessionLocal()
     try:
-        if CACHE_ENABLED and check_cache_validity(db):
-            return cache_data.get(key, [])
-        
-        # Cache disabled or invalid - query database directly
-        now = datetime.now(timezone.utc)
-        all_items = db.query(Schedule).all()
-        
-        results = []
-        for item in all_items:
-            try:
-                parsed_item = get_parsed_data(item)
-                
-                if key == "previous" and item.stop < now:
-                    results.append(parsed_item)
-                elif key == "upnext" and item.start > now:
-                    results.append(parsed_item)
-                elif key == "now" and item.start <= now <= item.stop:
-                    results.append(parsed_item)
-                elif key == "all":
-                    results.append(parsed_item)
-            except Exception:
-                # Skip malformed records
-                continue
-        
-        # Refresh cache if enabled but invalid
-        if CACHE_ENABLED and not check_cache_validity(db):
-            try:
-                refresh_cache(db)
-            except Exception:
-                # Cache refresh failed, continue with direct query results
-                pass
-        
-        return results
+        return check_cache_validity(db)
+    finally:
+        db.close()
+
+async def _cache_poller():
+    """Keep the published snapshot fresh so request handlers never touch the database"""
+    while True:
+        try:
+            await asyncio.sleep(CACHE_POLL_INTERVAL)
+            if not await asyncio.to_thread(cache_is_current):
+                await refresh_cache_coalesced()
+        except Exception:
+            logger.warning("Failed to refresh schedule cache")
+
+def empty_snapshot() -> CacheSnapshot:
+    empty = np.empty(0, dtype=np.int64)
+    empty_corpus = SearchCorpus("", np.zeros(1, dtype=np.int64))
+    return CacheSnapshot(empty, empty, empty, empty, [], empty_corpus, empty_corpus, fallback=True)
+
+async def get_schedule_data(db: Session) -> CacheSnapshot:
+    """Return the published cache snapshot, kept fresh by the background poller"""
+    try:
+        if not CACHE_ENABLED:
+            return load_schedule(db)
+        snapshot = cache_snapshot
+        if snapshot is None:
+            # Nothing published yet, e.g. the initial load failed
+            return await refresh_cache_coalesced()
+        return snapshot
     except Exception:
-        # Return empty list if database query fails completely
-        return []
+        # Empty schedule if database query fails completely
+        return empty_snapshot()
+
+def json_response(content: Any) -> Response:
+    """Serialize with orjson, bypassing response model validation"""
+    return Response(content=orjson.dumps(content), media_type="application/json")
+
+async def get_bucket_response(key: str, db: Session, request: Request) -> Response:
+    """Serve a time bucket, reusing its serialized body until the bucket changes"""
+    snapshot = await get_schedule_data(db)
+    # One clock read classifies the whole bucket
+    t = now_epoch_us()
+    
+    if not CACHE_ENABLED:
+        # Freshly loaded snapshot, nothing worth caching
+        return json_response(select_bucket(key, snapshot, t))
+    
+    if snapshot.fallback:
+        # Load failed, don't let clients hold on to the empty schedule
+        return Response(content=b"[]", media_type="application/json", headers={"Cache-Control": "no-store"})
+    
+    entry = snapshot.serialized.get(key)
+    if entry is None or not entry.valid_from <= t < entry.valid_until:
+        entry = serialize_bucket(key, snapshot, t)
+        snapshot.serialized[key] = entry
+    
+    # Clients may reuse the body until the TTL expires or the bucket changes,
+    # without a TTL database writes can land any time so they always revalidate
+    max_age = CACHE_TTL if CACHE_TTL > 0 else None
+    if max_age is not None and entry.valid_until != NEVER:
+        max_age = min(max_age, (entry.valid_until - t) // 1_000_000)
+    headers = {
+        "ETag": entry.etag,
+        "Last-Modified": entry.last_modified,
+        "Cache-Control": f"public, max-age={max_age}" if max_age is not None else "public, no-cache",
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
 
 @router.get(
     "/",
     response_model=List[Dict[str, Any]],
     summary="Get all schedule entries",
     description="Returns all schedule entries regardless of time.",
-    responses=create_schedule_responses("current")
+    responses=SCHEDULE_RESPONSES["current"]
 )
-async def get_all_schedule(db: Session = Depends(get_db)):
-    return get_cached_data("all", db)
+async def get_all_schedule(request: Request, db: Session = Depends(get_db)):
+    return await get_bucket_response("all", db, request)
 
 @router.get(
     "/previous",
     response_model=List[Dict[str, Any]],
     summary="Get past schedule entries",
     description="Returns all schedule entries that have ended (stop time is in the past).",
-    responses=create_schedule_responses("past")
+    responses=SCHEDULE_RESPONSES["past"]
 )
-async def get_previous_schedule(db: Session = Depends(get_db)):
-    return get_cached_data("previous", db)
+async def get_previous_schedule(request: Request, db: Session = Depends(get_db)):
+    return await get_bucket_response("previous", db, request)
 
 @router.get(
     "/upnext",
     response_model=List[Dict[str, Any]],
     summary="Get upcoming schedule entries", 
     description="Returns all schedule entries that haven't started yet (start time is in the future).",
-    responses=create_schedule_responses("future")
+    responses=SCHEDULE_RESPONSES["future"]
 )
-async def get_upnext_schedule(db: Session = Depends(get_db)):
-    return get_cached_data("upnext", db)
+async def get_upnext_schedule(request: Request, db: Session = Depends(get_db)):
+    return await get_bucket_response("upnext", db, request)
 
 @router.get(
     "/now",
     response_model=List[Dict[str, Any]],
     summary="Get currently active schedule entries",
     description="Returns all schedule entries that are currently active (current time is between start and stop times).",
-    responses=create_schedule_responses("current")
+    responses=SCHEDULE_RESPONSES["current"]
 )
-async def get_current_schedule(db: Session = Depends(get_db)):
-    return get_cached_data("now", db)
+async def get_current_schedule(request: Request, db: Session = Depends(get_db)):
+    return await get_bucket_response("now", db, request)
+
+def search_snapshot(snapshot: CacheSnapshot, title: Optional[str], description: Optional[str]) -> np.ndarray:
+    """Indices of /when matches for lower-cased needles, see CacheSnapshot.search"""
+    matches = search_index_rows(snapshot, title, description)
+    
+    if matches is None:
+        matches = np.empty(0, dtype=np.int64)
+        
+        if title:
+            matches = search_corpus(snapshot.title_corpus, title)
+        
+        if description:
+            matches = np.union1d(matches, search_corpus(snapshot.description_corpus, description))
+    
+    # Cached and shared between requests, a few bytes per match instead of whole bodies
+    matches = matches.astype(np.int32)
+    matches.flags.writeable = False
+    return matches
+
+def search_body(snapshot: CacheSnapshot, title: Optional[str], description: Optional[str]) -> bytes:
+    """Serialize /when results, normalizing needles so equivalent queries share a cache entry"""
+    matches = snapshot.search(title.lower() if title else None, description.lower() if description else None)
+    return orjson.dumps([snapshot.items[i] for i in matches])
 
 @router.get(
     "/when",
@@ -326,7 +792,7 @@ async def get_current_schedule(db: Session = Depends(get_db)):
     summary="Search schedule entries by content",
     description="Search for schedule entries by title or description. At least one search parameter must be provided.",
     responses={
-        **create_schedule_responses("search"),
+        **SCHEDULE_RESPONSES["search"],
         400: {
             "description": "Bad Request - No search parameters provided",
             "content": {
@@ -345,34 +811,39 @@ async def search_schedule(
     if not title and not description:
         raise HTTPException(status_code=400, detail="Either title or description must be provided")
     
-    all_items = get_cached_data("all", db)
-    results = []
-    
-    for item in all_items:
-        match = False
-        
-        if title and "title" in item:
-            if title.lower() in str(item["title"]).lower():
-                match = True
-        
-        if description and "description" in item:
-            if description.lower() in str(item["description"]).lower():
-                match = True
-        
-        if match:
-            results.append(item)
-    
-    return results
+    schedule = await get_schedule_data(db)
+    # Search may query the FTS index, keep that blocking I/O off the event loop
+    body = await asyncio.to_thread(search_body, schedule, title, description)
+    return Response(content=body, media_type="application/json")
+
+DATE_ONLY_PATTERN = re.compile(r"(\d{4})(-?)(\d{2})\2(\d{2})")
+# ciso8601 also accepts reduced dates (2023-01, 2023-W01-1), so only trust it with a time
+TIME_COMPONENT_PATTERN = re.compile(r"\d[T ]\d")
 
 def parse_timestamp_lenient(time_str: str) -> tuple[datetime, datetime]:
     """Parse timestamp with various formats, returning (start_time, end_time) for range queries"""
     try:
-        # Try ISO format first
-        if 'T' in time_str or '+' in time_str or 'Z' in time_str:
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+        # Fast path for ISO dates - return full day range
+        date_only = DATE_ONLY_PATTERN.fullmatch(time_str.strip())
+        if date_only:
+            year, month, day = map(int, date_only.group(1, 3, 4))
+            start_of_day = datetime(year, month, day, tzinfo=timezone.utc)
+            end_of_day = start_of_day.replace(hour=23, minute=59, second=59, microsecond=999999)
+            return (start_of_day, end_of_day)
+        
+        # Fast path for ISO timestamps via the C parser
+        try:
+            if not TIME_COMPONENT_PATTERN.search(time_str):
+                raise ValueError
+            dt = ciso8601.parse_datetime(time_str.strip())
+        except ValueError:
+            pass
+        else:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
             return (dt, dt)
         
-        # Use dateutil for flexible parsing
+        # Fall back to dateutil for flexible parsing
         parsed = parser.parse(time_str)
         
         # If no timezone info, assume UTC
@@ -401,7 +872,7 @@ def parse_timestamp_lenient(time_str: str) -> tuple[datetime, datetime]:
     summary="Get schedule entries for specific time or date",
     description="Returns schedule entries active at a specific time or during an entire date. Supports flexible time parsing.",
     responses={
-        **create_schedule_responses("time_query"),
+        **SCHEDULE_RESPONSES["time_query"],
         400: {
             "description": "Bad Request - Invalid time format",
             "content": {
@@ -423,23 +894,13 @@ async def get_schedule_at_time(
     try:
         query_start, query_end = parse_timestamp_lenient(time)
         
-        all_items = get_cached_data("all", db)
-        results = []
-        
-        for item in all_items:
-            try:
-                start_time = datetime.fromisoformat(item["start"].replace('Z', '+00:00'))
-                stop_time = datetime.fromisoformat(item["stop"].replace('Z', '+00:00'))
-                
-                # Check if show overlaps with query time range
-                # Show overlaps if: show_start <= query_end AND show_end >= query_start
-                if start_time <= query_end and stop_time >= query_start:
-                    results.append(item)
-            except Exception:
-                # Skip malformed timestamps in data
-                continue
+        schedule = await get_schedule_data(db)
         
-        return results
+        # Show overlaps if: show_start <= query_end AND show_end >= query_start
+        # Starts are sorted, so the first condition is a prefix of the arrays
+        started = int(np.searchsorted(schedule.starts, to_epoch_us(query_end), side="right"))
+        overlapping = np.flatnonzero(schedule.stops[:started] >= to_epoch_us(query_start))
+        return json_response([schedule.items[i] for i in overlapping])
     except HTTPException:
         raise
     except Exception:
@@ -518,8 +979,7 @@ async def get_restream():
     }
 )
 async def manual_cache_refresh(
-    api_key: str = Header(..., alias="X-API-Key", description="Admin API key for authentication"),
-    db: Session = Depends(get_db)
+    api_key: str = Header(..., alias="X-API-Key", description="Admin API key for authentication")
 ):
     if api_key != ADMIN_API_KEY:
         raise HTTPException(status_code=401, detail="Invalid API key")
@@ -527,7 +987,8 @@ async def manual_cache_refresh(
     if not CACHE_ENABLED:
         return {"message": "Cache is disabled"}
     
-    refresh_cache(db)
+    # Always a new load, an in-flight refresh may predate the caller's writes
+    await asyncio.to_thread(run_refresh)
     return {"message": "Cache refreshed successfully"}
 
 # Mount the router